@@ -4,6 +4,27 @@ from base import BlokusBase, Grid
 from typing import Optional
 
 
+def _legal_kernel(piece_mask: int, edge_mask: int, corner_mask: int,
+                  any_occ: int, own_occ: int) -> bool:
+    """
+    Pure-integer legality kernel for a non-first move: the piece must
+    not overlap played squares, must not share an edge with the
+    player's pieces, and must share at least one corner with them.
+
+    Inputs:
+        piece_mask [int]: bitmask of the squares the piece would cover
+        edge_mask [int]: bitmask of the piece's on-board edge neighbors
+        corner_mask [int]: bitmask of the piece's on-board corner neighbors
+        any_occ [int]: combined occupancy bitboard
+        own_occ [int]: the current player's occupancy bitboard
+
+    Returns [bool]: whether the placement is legal
+    """
+    return (piece_mask & any_occ == 0
+            and edge_mask & own_occ == 0
+            and corner_mask & own_occ != 0)
+
+
 class Blokus(BlokusBase):
     """
     Blokus class that pulls directly from the Blokus base
@@ -15,8 +36,19 @@ class Blokus(BlokusBase):
     _curr_player: int
     _shapes: dict[ShapeKind, Shape]
     _shapes_played: dict[int, list[ShapeKind]]
-    _grid: list[list[Optional[tuple[int, ShapeKind]]]]
+    _board: bytearray
+    _kinds: list[Optional[ShapeKind]]
+    _grid_cache: Optional[Grid]
     _retired: set[int]
+    _active_players: set[int]
+    _remaining: dict[int, set[ShapeKind]]
+    _score_remaining: dict[int, int]
+    _frontier: dict[int, set[Point]]
+    _occ: dict[int, int]
+    _any_occ: int
+    _start_mask: int
+    _placement_table: dict[tuple[ShapeKind, bool, int, Point],
+                           Optional[tuple[int, int, int]]]
 
     def __init__(self, num_players: int, size: int, start_positions: set[Point]) -> None:
         """
@@ -51,9 +83,57 @@ class Blokus(BlokusBase):
         self._shapes = {shape_kind: Shape.from_string(shape_kind, definition)
                         for shape_kind, definition in definitions.items()}
         self._shapes_played = {plr: [] for plr in range(1, num_players + 1)}
-        self._grid = [[None] * size for _ in range(size)]
         self._retired = set()
 
+        # Flat board storage: one byte per square holding the player
+        # number (0 for empty), plus a parallel flat list of shape kinds
+        # for the public grid view. The nested-list Grid is rebuilt
+        # lazily and cached until the next placement.
+        self._board = bytearray(size * size)
+        self._kinds = [None] * (size * size)
+        self._grid_cache = None
+
+        # Players who still get turns: neither retired nor out of shapes.
+        # Kept up to date by retire and maybe_place so game_over is O(1)
+        self._active_players = set(range(1, num_players + 1))
+
+        # Set-based view of each player's unplayed shapes, so membership
+        # checks on the hot paths are O(1) instead of list scans
+        self._remaining = {plr: set(self._shapes)
+                           for plr in range(1, num_players + 1)}
+
+        # Squares left unplayed per player, decremented on placement,
+        # so scores never have to be recomputed from the shape list
+        total_squares = sum(len(shape.squares)
+                            for shape in self._shapes.values())
+        self._score_remaining = {plr: total_squares
+                                 for plr in range(1, num_players + 1)}
+
+        # Corner frontier per player: the empty squares where one of the
+        # player's pieces could legally touch a corner, so move generation
+        # only has to try anchors near those squares instead of scanning
+        # the whole board. Seeded with the start positions for turn one.
+        self._frontier = {plr: set(start_positions)
+                          for plr in range(1, num_players + 1)}
+
+        # Occupancy bitboards: bit (x * size + y) stands for square (x, y).
+        # One board per player plus a combined board, so collision and
+        # corner/edge tests are single big-integer operations instead of
+        # per-square grid lookups.
+        self._occ = {plr: 0 for plr in range(1, num_players + 1)}
+        self._any_occ = 0
+
+        # Start positions as a bitmask, so the first-move test is a
+        # single AND against the piece mask
+        self._start_mask = 0
+        for x, y in start_positions:
+            self._start_mask |= 1 << (x * size + y)
+
+        # Cache of (piece, edge, corner) bitmasks per shape orientation
+        # and anchor, filled lazily by available_moves; None records an
+        # anchor whose placement would cross a wall
+        self._placement_table = {}
+
     ######## PROPERTIES
 
     @property
@@ -103,27 +183,22 @@ class Blokus(BlokusBase):
         """
         See BlokusBase
         """
-        return self._grid
+        if self._grid_cache is None:
+            size = self._size
+            self._grid_cache = [
+                [None if self._board[x * size + y] == 0
+                 else (self._board[x * size + y], self._kinds[x * size + y])
+                 for y in range(size)]
+                for x in range(size)]
+
+        return self._grid_cache
 
     @property
     def game_over(self) -> bool:
         """
         See BlokusBase
         """
-        current_player = self._curr_player
-
-        for player in range(1, self._num_players + 1):
-            self._curr_player = player
-
-            if player in self.retired_players:
-                continue
-            elif len(self.remaining_shapes(player)) <= 0:
-                continue
-            else:
-                self._curr_player = current_player
-                return False
-
-        return True
+        return len(self._active_players) == 0
     
     @property
     def winners(self) -> Optional[list[int]]:
@@ -142,15 +217,19 @@ class Blokus(BlokusBase):
 
     def progress_turn(self) -> None:
         """
-        Progresses to the next player's turn given there are players that aren't
-        retired with available turns and that the game is still in-progress.
+        Progresses to the next active player's turn, in cyclic order.
+        Leaves the current player unchanged if no players remain active.
         """
-        self._curr_player = (self.curr_player % self.num_players) + 1
+        if not self._active_players:
+            return
 
-        while ((self._curr_player in self.retired_players) or 
-               len(self.remaining_shapes(self._curr_player)) <= 0) and \
-                not self.game_over:
-            self._curr_player = (self._curr_player % self.num_players) + 1
+        next_player = self._curr_player
+        for _ in range(self._num_players):
+            next_player = (next_player % self._num_players) + 1
+
+            if next_player in self._active_players:
+                self._curr_player = next_player
+                return
             
     def remaining_shapes(self, player: int) -> list[ShapeKind]:
         """
@@ -160,26 +239,132 @@ class Blokus(BlokusBase):
         Inputs:
             player [int]: the player that we're evaluating
         
-        Returns [list[ShapeKind]]: the list of shapes that a player 
+        Returns [list[ShapeKind]]: the list of shapes that a player
             can still use
         """
         return [shape for shape in self.shapes.keys() \
-            if shape not in self._shapes_played[player]]
-        
+            if shape in self._remaining[player]]
+
+    def _piece_mask(self, piece: Piece) -> Optional[int]:
+        """
+        Returns the bitmask for the squares a piece would occupy,
+        where bit (x * size + y) stands for square (x, y). Returns
+        None if any square falls outside the board.
+
+        Inputs:
+            piece [Piece]: the piece to convert
+
+        Returns [Optional[int]]: the occupancy bitmask, or None
+        """
+        size = self._size
+        mask = 0
+
+        for x, y in piece.squares():
+            if x < 0 or x >= size or y < 0 or y >= size:
+                return None
+            mask |= 1 << (x * size + y)
+
+        return mask
+
+    def _neighbor_mask(self, neighbors: set[Point]) -> int:
+        """
+        Returns the bitmask for a set of neighbor squares, dropping
+        any that fall outside the board.
+
+        Inputs:
+            neighbors [set[Point]]: the neighbor squares to convert
+
+        Returns [int]: the occupancy bitmask
+        """
+        size = self._size
+        mask = 0
+
+        for x, y in neighbors:
+            if 0 <= x < size and 0 <= y < size:
+                mask |= 1 << (x * size + y)
+
+        return mask
+
+    def _anchored_masks(self, shape: Shape,
+                        anchor: Point) -> Optional[tuple[int, int, int]]:
+        """
+        Computes the (piece, edge, corner) bitmasks for a shape
+        anchored at a given point, dropping off-board neighbor bits.
+        Returns None if any of the shape's squares falls off the board.
+
+        Inputs:
+            shape [Shape]: the shape to anchor
+            anchor [Point]: the anchor point
+
+        Returns [Optional[tuple[int, int, int]]]: the three masks,
+            or None
+        """
+        size = self._size
+        ax, ay = anchor
+
+        piece_mask = 0
+        for dx, dy in shape.squares:
+            x, y = ax + dx, ay + dy
+            if not (0 <= x < size and 0 <= y < size):
+                return None
+            piece_mask |= 1 << (x * size + y)
+
+        edge_mask = self._neighbor_mask(
+            {(ax + dx, ay + dy) for dx, dy in shape.edge_offsets()})
+        corner_mask = self._neighbor_mask(
+            {(ax + dx, ay + dy) for dx, dy in shape.corner_offsets()})
+
+        return piece_mask, edge_mask, corner_mask
+
+    def _update_frontier(self, player: int, placed: list[Point]) -> None:
+        """
+        Updates the corner frontiers after a player places the given
+        squares. Placed squares stop being candidates for everyone,
+        squares now edge-adjacent to the placing player's pieces stop
+        being candidates for that player, and empty diagonal neighbors
+        of the new squares become candidates for that player.
+
+        Inputs:
+            player [int]: the player who placed the squares
+            placed [list[Point]]: the squares just placed
+
+        Returns None
+        """
+        size = self._size
+
+        for frontier in self._frontier.values():
+            frontier.difference_update(placed)
+
+        own_occ = self._occ[player]
+        frontier = self._frontier[player]
+
+        for x, y in placed:
+            for cx, cy in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                frontier.discard((cx, cy))
+
+            for cx, cy in ((x + 1, y + 1), (x + 1, y - 1),
+                           (x - 1, y + 1), (x - 1, y - 1)):
+                if not (0 <= cx < size and 0 <= cy < size):
+                    continue
+                elif (1 << (cx * size + cy)) & self._any_occ:
+                    continue
+
+                edge_mask = self._neighbor_mask(
+                    {(cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)})
+                if not edge_mask & own_occ:
+                    frontier.add((cx, cy))
+
     def any_wall_collisions(self, piece: Piece) -> bool:
         """
         See BlokusBase
         """
         if not piece.anchor:
             raise ValueError("Piece anchor is not set.")
-        elif piece.shape.kind not in self.remaining_shapes(self._curr_player):
+        elif __debug__ and \
+                piece.shape.kind not in self._remaining[self._curr_player]:
             raise ValueError("Player does not have the specified piece.")
-        
-        for x, y in piece.squares():
-            if x < 0 or x >= self.size or y < 0 or y >= self.size:
-                return True
-            
-        return False
+
+        return self._piece_mask(piece) is None
 
     def any_collisions(self, piece: Piece) -> bool:
         """
@@ -187,17 +372,15 @@ class Blokus(BlokusBase):
         """
         if not piece.anchor:
             raise ValueError("Piece anchor is not set.")
-        elif piece.shape.kind not in self.remaining_shapes(self._curr_player):
+        elif __debug__ and \
+                piece.shape.kind not in self._remaining[self._curr_player]:
             raise ValueError("Player does not have the specified piece.")
-        
-        if self.any_wall_collisions(piece):
-            return True
-        
-        for x, y in piece.squares():
-            if self.grid[x][y] is not None:
-                return True
-        
-        return False
+
+        # _piece_mask already folds the wall test into the mask build
+        # (None means off-board), so one pass over the squares covers
+        # both the wall and the overlap checks
+        mask = self._piece_mask(piece)
+        return mask is None or (mask & self._any_occ) != 0
 
     def legal_to_place(self, piece: Piece) -> bool:
         """
@@ -205,46 +388,27 @@ class Blokus(BlokusBase):
         """
         if not piece.anchor:
             raise ValueError("Piece anchor is not set.")
-        elif piece.shape.kind not in self.remaining_shapes(self._curr_player):
+        elif __debug__ and \
+                piece.shape.kind not in self._remaining[self._curr_player]:
             raise ValueError("Player does not have the specified piece.")
 
-        if self.any_collisions(piece):
+        piece_mask = self._piece_mask(piece)
+        if piece_mask is None:
             return False
-        elif len(self._shapes_played[self._curr_player]) <= 0:
-            touching_start = False
-            
-            for square in piece.squares():
-                if square in list(self._start_positions):
-                    touching_start = True
-            if not touching_start:
-                return False
-        else:
-             # Corners = intercardinal neighbors, edges = cardinal neighbors
-            touching_corner = False
-            edges, corners = piece.cardinal_neighbors(), \
-                piece.intercardinal_neighbors()
 
-            # Edges rule 
-            for x, y in edges:
-                x, y = min(self.size - 1, max(0, x)), min(self.size - 1, max(0, y))
-                edge_on_grid = self._grid[x][y] 
+        if len(self._shapes_played[self._curr_player]) <= 0:
+            if piece_mask & self._any_occ:
+                return False
 
-                if edge_on_grid and edge_on_grid[0] == self._curr_player:
-                    return False
+            # First move must cover a start position
+            return piece_mask & self._start_mask != 0
 
-            # Corners rule
-            for x, y in corners:
-                x, y = min(self.size - 1, max(0, x)), min(self.size - 1, max(0, y))
-                corner_on_grid = self._grid[x][y] 
+        # Corners = intercardinal neighbors, edges = cardinal neighbors
+        edge_mask = self._neighbor_mask(piece.cardinal_neighbors())
+        corner_mask = self._neighbor_mask(piece.intercardinal_neighbors())
 
-                if corner_on_grid and corner_on_grid[0] == self._curr_player:
-                    touching_corner = True
-
-            # Make sure that it's touching a corner
-            if not touching_corner:
-                return False
-        
-        return True
+        return _legal_kernel(piece_mask, edge_mask, corner_mask,
+                             self._any_occ, self._occ[self._curr_player])
 
     def maybe_place(self, piece: Piece) -> bool:
         """
@@ -255,59 +419,148 @@ class Blokus(BlokusBase):
         if current_player not in self.retired_players:
             if not piece.anchor:
                 raise ValueError("Piece anchor is not set.")
-            elif piece.shape.kind not in self.remaining_shapes(current_player):
+            elif __debug__ and \
+                    piece.shape.kind not in self._remaining[current_player]:
                 raise ValueError("Player does not have the specified piece.")
             elif not self.legal_to_place(piece):
                 return False
-            
-            for x, y in piece.squares():
-                self._grid[x][y] = (current_player, piece.shape.kind)
 
-            self._shapes_played[current_player].append(piece.shape.kind)
+            self._place(piece)
+
+        self.progress_turn()
+        return True
+
+    def place_legal(self, piece: Piece) -> bool:
+        """
+        Places a piece already known to be legal -- for example, one
+        drawn from available_moves -- skipping the legality re-check
+        that maybe_place performs. Updates the current player and
+        returns True.
+
+        The validation that maybe_place raises for is kept only as
+        debug assertions, so running with -O strips it entirely.
 
+        Inputs:
+            piece [Piece]: the piece to place
+
+        Returns [bool]: True (the piece is assumed legal)
+        """
+        if __debug__:
+            if not piece.anchor:
+                raise ValueError("Piece anchor is not set.")
+            elif piece.shape.kind not in self._remaining[self._curr_player]:
+                raise ValueError("Player does not have the specified piece.")
+
+        self._place(piece)
         self.progress_turn()
         return True
 
+    def _place(self, piece: Piece) -> None:
+        """
+        Writes a piece onto the board for the current player and
+        updates the derived game state (bitboards, remaining shapes,
+        frontiers, active players).
+
+        Inputs:
+            piece [Piece]: the piece to place
+
+        Returns None
+        """
+        current_player = self._curr_player
+
+        mask = 0
+        for x, y in piece.squares():
+            self._board[x * self._size + y] = current_player
+            self._kinds[x * self._size + y] = piece.shape.kind
+            mask |= 1 << (x * self._size + y)
+
+        self._occ[current_player] |= mask
+        self._any_occ |= mask
+        self._grid_cache = None
+        self._shapes_played[current_player].append(piece.shape.kind)
+        self._remaining[current_player].discard(piece.shape.kind)
+        self._score_remaining[current_player] -= len(piece.shape.squares)
+        self._update_frontier(current_player, piece.squares())
+
+        if not self._remaining[current_player]:
+            self._active_players.discard(current_player)
+
     def retire(self) -> None:
         """
         See BlokusBase
         """
         self._retired.add(self._curr_player)
+        self._active_players.discard(self._curr_player)
         self.progress_turn()
 
     def get_score(self, player: int) -> int:
         """
         See BlokusBase
         """
-        remaining_shapes = self.remaining_shapes(player)
-        
-        if len(remaining_shapes) > 0:
-            score = 0
-            for shape in remaining_shapes:
-                score -= len(self.shapes[shape].squares)
-            return score
+        if self._remaining[player]:
+            return -self._score_remaining[player]
         elif len(self.shapes[self._shapes_played[player][-1]].squares) == 1:
             return 20
         else:
             return 15
 
-    def available_moves(self) -> set[Piece]:
-        """
-        See BlokusBase
-        """
-        moves_left = set()
-
-        for shape_kind in self.remaining_shapes(self.curr_player):
+    def available_moves(self) -> list[tuple[ShapeKind, Point, bool, int]]:
+        """
+        See BlokusBase. Unlike the base class description, moves are
+        returned as a list of (shape kind, anchor, face_up, rotation)
+        tuples rather than a set of Piece instances; callers
+        materialize a Piece only for the move they actually select.
+        Every geometrically distinct orientation of each remaining
+        shape is considered, with symmetric orientations deduplicated
+        up front, so each entry is a unique placement.
+        """
+        moves_left: list[tuple[ShapeKind, Point, bool, int]] = []
+        curr = self.curr_player
+        frontier = self._frontier[curr]
+        first_move = len(self._shapes_played[curr]) <= 0
+        any_occ, own_occ = self._any_occ, self._occ[curr]
+        table = self._placement_table
+
+        # Iterate shapes in definition order rather than set order, so
+        # the move list -- and anything seeded that samples from it --
+        # is reproducible across processes
+        remaining = self._remaining[curr]
+        for shape_kind in self.shapes:
+            if shape_kind not in remaining:
+                continue
             shape = self.shapes[shape_kind]
-            test_piece = Piece(shape)
-
-            for x in range(self.size):
-                for y in range(self.size):
-                    test_piece.set_anchor((x, y))
-                    
-                    if self.legal_to_place(test_piece):
-                        piece = Piece(shape)
-                        piece.set_anchor((x, y))
-                        moves_left.add(piece)
+
+            for face_up, rotation, oriented in shape.canonical_orientations():
+                seen_anchors: set[Point] = set()
+
+                # Any legal placement covers a frontier square, so only
+                # try anchors that put a piece square on the frontier
+                for fx, fy in frontier:
+                    for dx, dy in oriented.squares:
+                        anchor = (fx - dx, fy - dy)
+                        if anchor in seen_anchors:
+                            continue
+                        seen_anchors.add(anchor)
+
+                        key = (shape_kind, face_up, rotation, anchor)
+                        if key not in table:
+                            table[key] = self._anchored_masks(oriented,
+                                                              anchor)
+                        masks = table[key]
+                        if masks is None:
+                            continue
+                        piece_mask, edge_mask, corner_mask = masks
+
+                        if first_move:
+                            legal = (piece_mask & any_occ == 0
+                                     and piece_mask & self._start_mask != 0)
+                        else:
+                            legal = _legal_kernel(piece_mask, edge_mask,
+                                                  corner_mask, any_occ,
+                                                  own_occ)
+
+                        if legal:
+                            moves_left.append((shape_kind, anchor,
+                                               face_up, rotation))
 
         return moves_left
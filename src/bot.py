@@ -6,25 +6,22 @@ Usage: $ python3 src/bot.py NUM_GAMES
 ### MODULES
 from abc import ABC, abstractmethod
 
-# Block the annoying pygame message
-from os import environ
-environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
-
 import click
 import random
-import pygame
+import time
 from blokus import Blokus
 from piece import Point, Piece
+from shape_definitions import ShapeKind
 from typing import Optional
 
 ### CONSTANTS (SETTINGS)
 
-CLOCK: pygame.time.Clock = pygame.time.Clock()
 BOARD_SIZE: int = 11
 
 DEFAULT_NUM_GAMES: int = 20
 DEFAULT_BOT_ONE: str = 'N'
 DEFAULT_BOT_TWO: str = 'N'
+DEFAULT_SEED: Optional[int] = None
 
 ### CLASSES
 
@@ -33,18 +30,37 @@ class BotBase(ABC):
     Abstract base class for Bot classes.
     '''
     _game_object: Blokus
+    _rng: random.Random
 
-    def __init__(self, game_object: Blokus) -> None:
+    def __init__(self, game_object: Blokus,
+                 rng: Optional[random.Random] = None) -> None:
         '''
-        Subclasses should have constructors which accept this argument:
+        Subclasses should have constructors which accept these arguments:
             game_object: the game object that is going to be referenced
+            rng: the random generator for any stochastic decisions; pass
+                a seeded random.Random for reproducible simulations
         '''
         self._game_object = game_object
+        self._rng = rng if rng is not None else random.Random()
 
     @property
     def game(self) -> Blokus:
         'Returns the referencing Blokus game object'
         return self._game_object
+
+    def make_piece(self, move: tuple[ShapeKind, Point, bool, int]) -> Piece:
+        '''
+        Builds an anchored, oriented Piece from an available_moves entry.
+
+        Paramaters:
+            move [tuple[ShapeKind, Point, bool, int]]: the selected move
+
+        Returns [Piece]: the piece ready to place
+        '''
+        shape_kind, anchor, face_up, rotation = move
+        piece = Piece(self.game.shapes[shape_kind], face_up, rotation)
+        piece.set_anchor(anchor)
+        return piece
     
     @abstractmethod
     def place_piece(self) -> None:
@@ -62,11 +78,12 @@ class U_Bot(BotBase):
     '''
     _game_object: Blokus
 
-    def __init__(self, game_object: Blokus) -> None:
+    def __init__(self, game_object: Blokus,
+                 rng: Optional[random.Random] = None) -> None:
         '''
         Initialization of the unsatisfactory bot
         '''
-        super().__init__(game_object)
+        super().__init__(game_object, rng)
 
     def place_piece(self) -> None:
         '''
@@ -81,13 +98,10 @@ class U_Bot(BotBase):
             self.game.retire()
             return
         
-        # Rank the smallest pieces available to place
-        smallest_piece = min([len(piece.shape.squares) for piece in available_moves])
-
-        for piece in available_moves:
-            if len(piece.squares()) == smallest_piece:
-                self.game.maybe_place(piece)
-                return
+        # Place one of the smallest pieces available, found in one pass
+        smallest_move = min(available_moves,
+                            key = lambda move: len(self.game.shapes[move[0]].squares))
+        self.game.place_legal(self.make_piece(smallest_move))
         
 class N_Bot(BotBase):
     '''
@@ -95,11 +109,12 @@ class N_Bot(BotBase):
     '''
     _game_object: Blokus
 
-    def __init__(self, game_object: Blokus) -> None:
+    def __init__(self, game_object: Blokus,
+                 rng: Optional[random.Random] = None) -> None:
         '''
         Initialization of the needs improvement bot
         '''
-        super().__init__(game_object)
+        super().__init__(game_object, rng)
 
     def place_piece(self) -> None:
         '''
@@ -112,7 +127,8 @@ class N_Bot(BotBase):
         if len(available_moves) == 0:
             self.game.retire()
         else:
-            self.game.maybe_place(random.choice(list(available_moves)))
+            move = self._rng.choice(available_moves)
+            self.game.place_legal(self.make_piece(move))
 
 class S_Bot(BotBase):
     '''
@@ -120,11 +136,12 @@ class S_Bot(BotBase):
     '''
     _game_object: Blokus
 
-    def __init__(self, game_object: Blokus) -> None:
+    def __init__(self, game_object: Blokus,
+                 rng: Optional[random.Random] = None) -> None:
         '''
         Initialization of the satisfactory bot
         '''
-        super().__init__(game_object)
+        super().__init__(game_object, rng)
 
     def place_piece(self) -> None:
         '''
@@ -139,13 +156,10 @@ class S_Bot(BotBase):
             self.game.retire()
             return
         
-        # Rank the largest pieces available to place
-        largest_piece = max([len(piece.shape.squares) for piece in available_moves])
-
-        for piece in available_moves:
-            if len(piece.squares()) == largest_piece:
-                self.game.maybe_place(piece)
-                return
+        # Place one of the largest pieces available, found in one pass
+        largest_move = max(available_moves,
+                           key = lambda move: len(self.game.shapes[move[0]].squares))
+        self.game.place_legal(self.make_piece(largest_move))
 
 # MAIN SEQUENCE
 
@@ -156,8 +170,13 @@ class S_Bot(BotBase):
     help = "Strategy for Bot #1")
 @click.option("--strategy_2", "-2", type = str, default = DEFAULT_BOT_TWO, \
     help = "Strategy for Bot #2")
+@click.option("--throttle/--no-throttle", default = False, \
+    help = "Spread the games over two extra seconds of wall-clock time")
+@click.option("--seed", type = int, default = DEFAULT_SEED, \
+    help = "Seed for reproducible simulations")
 
-def run_bot_simulation(num_games: int, strategy_1: str, strategy_2: str) -> None:
+def run_bot_simulation(num_games: int, strategy_1: str, strategy_2: str,
+                       throttle: bool, seed: Optional[int]) -> None:
     '''
     Handles the main bot simulation logic, taking two strategies and playing them
         against each other
@@ -166,9 +185,12 @@ def run_bot_simulation(num_games: int, strategy_1: str, strategy_2: str) -> None
         num_games [int]: the number of games we're running
         strategy_1 [str]: the string representation of first bot strategy
         strategy_2 [str]: the string representation of second bot strategy
+        throttle [bool]: whether to pace the games in real time
+        seed [Optional[int]]: seed for the bots' random generator
 
     Returns None.
     '''
+    rng = random.Random(seed)
     bots = {1: strategy_1, 2: strategy_2}
     wins_count, ties_count = {key: 0 for key in bots.keys()}, 0
 
@@ -178,9 +200,9 @@ def run_bot_simulation(num_games: int, strategy_1: str, strategy_2: str) -> None
         bot_blokus = Blokus(len(bots.keys()), BOARD_SIZE, start_positions)
 
         bot_objects = {key: (
-            S_Bot(bot_blokus) if value == 'S' else
-            N_Bot(bot_blokus) if value == 'N' else
-            U_Bot(bot_blokus) if value == 'U' else
+            S_Bot(bot_blokus, rng) if value == 'S' else
+            N_Bot(bot_blokus, rng) if value == 'N' else
+            U_Bot(bot_blokus, rng) if value == 'U' else
             None) for key, value in bots.items()}
         
         while not bot_blokus.game_over:
@@ -193,14 +215,11 @@ def run_bot_simulation(num_games: int, strategy_1: str, strategy_2: str) -> None
             # Runs the place piece function for the bot
             bot_object.place_piece()
 
-        # Similar to wait(1/value); can alter to simulate faster; we want it to wait
-        # two more seconds regardless of test volume optimally. Additionally, this 
-        # slows the entire environment, not just the script, so entire terminal
-        # yields including Ctrl+C to stop
-
-        # Equals wait(1/(2 * NUM_GAMES)) or 2 seconds dispersed between all the
-        # test cases; 2 seconds on top of however long it takes to run to space it
-        CLOCK.tick(num_games / 2)
+        # Equals wait(2 / NUM_GAMES) or 2 seconds dispersed between all
+        # the test cases, purely to pace the output; off by default since it
+        # dominates wall-clock time when benchmarking
+        if throttle:
+            time.sleep(2 / num_games)
 
         # Now track the winner of this given round to be reported later
         winners = bot_blokus.winners
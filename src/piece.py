@@ -46,6 +46,9 @@ class Shape:
     origin: Point
     can_be_transformed: bool
     squares: list[Point]
+    _edge_offsets: Optional[frozenset[Point]]
+    _corner_offsets: Optional[frozenset[Point]]
+    _canonical: Optional[list[tuple[bool, int, "Shape"]]]
 
     def __init__(
         self,
@@ -62,6 +65,13 @@ class Shape:
         self.can_be_transformed = can_be_transformed
         self.squares = squares
 
+        # Neighbor offsets are a fixed function of the squares, so they
+        # are computed once per orientation and dropped on transforms,
+        # as is the list of canonical orientations
+        self._edge_offsets = None
+        self._corner_offsets = None
+        self._canonical = None
+
     def __str__(self) -> str:
         """
         Returns a complete string representation of the
@@ -117,6 +127,9 @@ class Shape:
 
             flipped.append((r, new_column))
         self.squares = flipped
+        self._edge_offsets = None
+        self._corner_offsets = None
+        self._canonical = None
 
     def rotate_left(self) -> None:
         """
@@ -131,6 +144,9 @@ class Shape:
 
             flipped.append((new_row, new_column))
         self.squares = flipped
+        self._edge_offsets = None
+        self._corner_offsets = None
+        self._canonical = None
 
     def rotate_right(self) -> None:
         """
@@ -145,6 +161,97 @@ class Shape:
 
             flipped.append((new_row, new_column))
         self.squares = flipped
+        self._edge_offsets = None
+        self._corner_offsets = None
+        self._canonical = None
+
+    def canonical_orientations(self) -> list[tuple[bool, int, "Shape"]]:
+        """
+        Returns one (face_up, rotation, shape) entry per geometrically
+        distinct orientation of the shape, where the arguments mirror
+        those of the Piece constructor and the shape holds the
+        transformed squares. Orientations whose squares coincide up to
+        translation are deduplicated, so symmetric shapes yield fewer
+        than eight entries, and shapes that cannot be transformed
+        yield exactly one.
+        """
+        if self._canonical is None:
+            orientations = []
+            seen: set[frozenset[Point]] = set()
+
+            flips = (True, False) if self.can_be_transformed else (True,)
+            rotations = 4 if self.can_be_transformed else 1
+            for face_up in flips:
+                # Like Piece: flip first (face down), then rotate right
+                squares = self.squares if face_up else \
+                    [(r, -c) for r, c in self.squares]
+
+                for rotation in range(rotations):
+                    if rotation > 0:
+                        squares = [(c, -r) for r, c in squares]
+
+                    # Translation-normalized footprint, so orientations
+                    # that only shift the squares collapse together
+                    min_r = min(r for r, c in squares)
+                    min_c = min(c for r, c in squares)
+                    key = frozenset((r - min_r, c - min_c)
+                                    for r, c in squares)
+
+                    if key not in seen:
+                        seen.add(key)
+                        orientations.append((face_up, rotation,
+                                             Shape(self.kind, self.origin,
+                                                   self.can_be_transformed,
+                                                   list(squares))))
+
+            self._canonical = orientations
+
+        return self._canonical
+
+    def _compute_neighbor_offsets(self) -> None:
+        """
+        Compute the deduplicated edge (cardinal) and corner
+        (intercardinal) neighbor offsets for the current orientation,
+        excluding the shape's own squares.
+        """
+        squares = set(self.squares)
+        edges = {(r + dr, c + dc) for r, c in squares
+                 for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1))} - squares
+        corners = {(r + dr, c + dc) for r, c in squares
+                   for dr, dc in ((1, 1), (1, -1), (-1, 1), (-1, -1))} \
+            - squares - edges
+
+        self._edge_offsets = frozenset(edges)
+        self._corner_offsets = frozenset(corners)
+
+    def edge_offsets(self) -> frozenset[Point]:
+        """
+        Returns the edge-neighbor offsets for the current orientation,
+        relative to the origin.
+        """
+        if self._edge_offsets is None:
+            self._compute_neighbor_offsets()
+        assert self._edge_offsets is not None
+        return self._edge_offsets
+
+    def corner_offsets(self) -> frozenset[Point]:
+        """
+        Returns the corner-neighbor offsets for the current orientation,
+        relative to the origin. Offsets that are also edge neighbors are
+        excluded, since the edge rule already rejects those squares.
+        """
+        if self._corner_offsets is None:
+            self._compute_neighbor_offsets()
+        assert self._corner_offsets is not None
+        return self._corner_offsets
+
+# Stride and offset used to pack squares into the placement bitmask
+# that backs Piece hashing and equality. The stride accommodates any
+# supported board width, and the offset keeps bit positions
+# non-negative for pieces hanging slightly past the top-left edge.
+_MASK_STRIDE = 64
+_MASK_OFFSET = 16
+
 
 class Piece:
     """
@@ -163,6 +270,8 @@ class Piece:
 
     shape: Shape
     anchor: Optional[Point]
+    _squares_cache: Optional[list[Point]]
+    _mask: Optional[int]
 
     def __init__(self, shape: Shape, face_up: bool = True, rotation: int = 0):
         """
@@ -181,6 +290,11 @@ class Piece:
         # The anchor will be set by set_anchor
         self.anchor = None
 
+        # Cached results of squares() and placement_mask(), recomputed
+        # only after the anchor or orientation changes
+        self._squares_cache = None
+        self._mask = None
+
         # We choose to flip...
         if not face_up:
             self.shape.flip_horizontally()
@@ -194,6 +308,8 @@ class Piece:
         Set the anchor point.
         """
         self.anchor = anchor
+        self._squares_cache = None
+        self._mask = None
 
     def _check_anchor(self) -> None:
         """
@@ -210,6 +326,8 @@ class Piece:
         """
         self._check_anchor()
         self.shape.flip_horizontally()
+        self._squares_cache = None
+        self._mask = None
 
     def rotate_left(self) -> None:
         """
@@ -218,6 +336,8 @@ class Piece:
         """
         self._check_anchor()
         self.shape.rotate_left()
+        self._squares_cache = None
+        self._mask = None
 
     def rotate_right(self) -> None:
         """
@@ -226,6 +346,8 @@ class Piece:
         """
         self._check_anchor()
         self.shape.rotate_right()
+        self._squares_cache = None
+        self._mask = None
 
     def squares(self) -> list[Point]:
         """
@@ -236,12 +358,45 @@ class Piece:
         """
         self._check_anchor()
         assert self.anchor is not None
-        squares = [
-            (row(self.anchor) + r, col(self.anchor) + c)
-            for r, c in self.shape.squares
-        ]
 
-        return squares
+        if self._squares_cache is None:
+            self._squares_cache = [
+                (row(self.anchor) + r, col(self.anchor) + c)
+                for r, c in self.shape.squares
+            ]
+
+        return self._squares_cache
+
+    def placement_mask(self) -> int:
+        """
+        Returns an integer bitmask uniquely identifying the squares
+        the piece would cover, for cheap hashing and equality.
+
+        Raises ValueError if anchor is not set.
+        """
+        if self._mask is None:
+            mask = 0
+            for r, c in self.squares():
+                mask |= 1 << ((r + _MASK_OFFSET) * _MASK_STRIDE
+                              + (c + _MASK_OFFSET))
+            self._mask = mask
+
+        return self._mask
+
+    def __hash__(self) -> int:
+        """
+        Pieces hash by the squares they would cover, so two pieces
+        that land on the same squares collapse to one set entry.
+        """
+        return hash(self.placement_mask())
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Pieces compare equal when they would cover the same squares.
+        """
+        if not isinstance(other, Piece):
+            return NotImplemented
+        return self.placement_mask() == other.placement_mask()
 
     def cardinal_neighbors(self) -> set[Point]:
         """
@@ -252,16 +407,10 @@ class Piece:
         Raises ValueError if anchor is not set.
         """
         self._check_anchor()
-        cardinal = set()
-        for sqaure in self.squares():
-            r, c = sqaure
-
-            cardinal.add((r + 1, c))
-            cardinal.add((r - 1, c))
-            cardinal.add((r, c + 1))
-            cardinal.add((r, c - 1))
-        
-        return cardinal
+        assert self.anchor is not None
+        (ar, ac) = self.anchor
+
+        return {(ar + r, ac + c) for r, c in self.shape.edge_offsets()}
 
 
     def intercardinal_neighbors(self) -> set[Point]:
@@ -273,14 +422,8 @@ class Piece:
         Raises ValueError if anchor is not set.
         """
         self._check_anchor()
+        assert self.anchor is not None
+        (ar, ac) = self.anchor
 
-        intercardinal = set()
-        for square in self.squares():
-            r, c = square
-            intercardinal.add((r + 1, c - 1))
-            intercardinal.add((r + 1, c + 1))
-            intercardinal.add((r - 1, c + 1))
-            intercardinal.add((r - 1, c - 1))
-
-        return intercardinal
+        return {(ar + r, ac + c) for r, c in self.shape.corner_offsets()}
         
\ No newline at end of file
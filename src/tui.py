@@ -1,9 +1,26 @@
 import curses
+import numpy as np
 from piece import Piece
 from curses import wrapper
 from blokus import Blokus, ShapeKind, Point, Shape
 import click
-from typing import Optional, Tuple, List, Dict, Set
+from typing import Callable, Optional, Tuple, List, Dict, Set
+
+# Cell-state codes for the frame arrays, and the symbol drawn for each
+_CELL_EMPTY, _CELL_START, _CELL_PIECE, _CELL_PLACED = range(4)
+_CELL_SYMBOLS = (".", "S", "▣", "▣")
+
+# Preset game modes: number of players, board size, start positions.
+# Built once at import; mini alone varies its player count, which
+# run_tui special-cases.
+GAME_MODES: Dict[str, Tuple[int, int, frozenset]] = {
+    'mono': (1, 11, frozenset({(5, 5)})),
+    'duo': (2, 14, frozenset({(4, 4), (9, 9)})),
+    'classic-2': (2, 20, frozenset({(0, 0), (19, 19)})),
+    'classic-3': (3, 20, frozenset({(0, 0), (19, 0), (0, 19)})),
+    'classic-4': (4, 20, frozenset({(0, 0), (19, 0), (0, 19), (19, 19)})),
+    'mini': (2, 5, frozenset({(0, 0), (4, 4)})),
+}
 
 class BlokusTUI:
     """
@@ -29,12 +46,64 @@ class BlokusTUI:
         curses.init_pair(4, curses.COLOR_MAGENTA, curses.COLOR_BLACK)
         curses.init_pair(5, curses.COLOR_YELLOW, curses.COLOR_BLACK)
         self.colors = [1, 2, 3, 4, 5]
+
+        # Resolve every color pair to its attribute value once;
+        # _print indexes this instead of calling curses.color_pair
+        # for each cell it paints
+        self._pair_cache = tuple(curses.color_pair(i) for i in range(6))
+
+        # Double-buffering setup: hide the cursor, let curses skip
+        # repositioning it between writes, and block on input.
+        # draw_board stages all changes on the virtual screen with
+        # noutrefresh and applies them in one burst with doupdate,
+        # so partial frames never reach the terminal.
+        curses.curs_set(0)
+        self.screen.leaveok(True)
+        self.screen.scrollok(False)
+        self.screen.nodelay(False)
         
         self.size = self.blokus.size
         self.piece: Optional[Piece] = None
-        self.placed_pieces: Dict[Tuple[int, int], Tuple[int, str]] = {}  # Dict to store placed pieces
+        # Color of each placed cell, 0 where nothing has been placed;
+        # the placed symbol is always "▣" so only the color is stored
+        self.placed_color = np.zeros((self.size, self.size), dtype=np.uint8)
         self.dict_shapes = self.blokus._shapes  # Loads shapes
 
+        # Per-player remaining shapes mirrored as sets, so selecting a
+        # piece is one membership test instead of fetching the list
+        # from the game on every keystroke
+        self._remaining: Dict[int, Set[ShapeKind]] = {
+            player: set(self.blokus.remaining_shapes(player))
+            for player in range(1, self.blokus.num_players + 1)
+        }
+
+        # Cell-state and color arrays of the last frame drawn, so
+        # redraws only touch cells whose state or color actually
+        # changed (damage tracking). None until the first draw paints
+        # the background.
+        self._prev_kind: Optional[np.ndarray] = None
+        self._prev_color: Optional[np.ndarray] = None
+
+        # One full background row of dots, built once and reused for
+        # every row of the initial board paint
+        self._empty_row = "." * self.size
+
+        # Start positions snapshotted once; they never change, and a
+        # start cell is covered exactly when a piece was placed on it
+        self._start_cells = tuple(self.blokus.start_positions)
+
+        # Row for the status / game over line, below the footer
+        self._status_row = self.size + self.blokus.num_players + 5
+
+        # Signature of the footer last drawn; the footer only changes
+        # on placements and retires, so most redraws skip it entirely
+        self._footer_key: Optional[tuple] = None
+
+        # Collision state of the pending piece, recomputed only after
+        # the piece is selected, moved, rotated, or flipped
+        self._cached_collision = False
+        self._piece_collision_dirty = True
+
         # Dict of keyboard actions
         self.key_actions: Dict[int, ShapeKind] = {
             ord('1'): ShapeKind.ONE, ord('2'): ShapeKind.TWO,
@@ -48,6 +117,23 @@ class BlokusTUI:
             ord('y'): ShapeKind.Y, ord('z'): ShapeKind.Z
         }
 
+        # Piece-manipulation keys dispatched through one dict lookup;
+        # enter, retire, and escape stay special-cased since they act
+        # on game and TUI state rather than the pending piece
+        self._piece_actions: Dict[int, Callable[[Piece], None]] = {
+            curses.KEY_UP:
+                lambda p: p.set_anchor((p.anchor[0] - 1, p.anchor[1])),
+            curses.KEY_DOWN:
+                lambda p: p.set_anchor((p.anchor[0] + 1, p.anchor[1])),
+            curses.KEY_LEFT:
+                lambda p: p.set_anchor((p.anchor[0], p.anchor[1] - 1)),
+            curses.KEY_RIGHT:
+                lambda p: p.set_anchor((p.anchor[0], p.anchor[1] + 1)),
+            ord('r'): Piece.rotate_right,
+            ord('e'): Piece.rotate_left,
+            ord(' '): Piece.flip_horizontally,
+        }
+
     def _print(self, string: str, color: int, row: Optional[int] = None,
                 col: Optional[int] = None) -> None:
         """
@@ -62,66 +148,155 @@ class BlokusTUI:
         Returns [None]: prints out a given string
         """
         if row is not None and col is not None:
-            self.screen.addstr(row, col, string, curses.color_pair(color))
+            self.screen.addstr(row, col, string, self._pair_cache[color])
         else:
-            self.screen.addstr(string, curses.color_pair(color))
+            self.screen.addstr(string, self._pair_cache[color])
+
+    def _write_line(self, row: int, segments: List[Tuple[str, int]]) -> None:
+        """
+        Writes colored text segments left-to-right on one row, clearing
+        whatever the row held before
+
+        Inputs:
+            row[int]: Row on the screen to write
+            segments[List[Tuple[str, int]]]: (text, color pair) runs
+
+        Returns [None]: prints the row
+        """
+        self.screen.move(row, 0)
+        self.screen.clrtoeol()
+
+        col = 0
+        for text, color in segments:
+            self._print(text, color, row, col)
+            col += len(text)
 
     def draw_board(self) -> None:
         """
-        Draws the TUI board
+        Draws the TUI board, repainting only the cells that changed
+        since the last draw
 
         Input:
             None besides self
 
         Returns [None]: prints TUI
         """
-        for row in range(self.size):
-            for col in range(self.size):
-                valid_piece = self.piece != None and (row, col) in self.piece.squares()
-
-                # Prints the pending piece onto the board
-                if valid_piece and not self.blokus.any_collisions(self.piece):
-                    color = self.colors[self.blokus.curr_player - 1]
-                    self._print("▣", color, row, col)
-
-                # Prints the start positions at beggining of game
-                elif (row, col) in self.blokus.start_positions and self.blokus.grid[row][col] is None:
-                    self._print("S", self.colors[4], row, col)
-
-                # Prints already placed pieces
-                elif (row, col) in self.placed_pieces:
-                    color, symbol = self.placed_pieces[(row, col)]
-                    self._print(symbol, color, row, col)
-                
-                # Prints the grid using dots
-                else:
-                    self._print(".", 0, row, col)
-
-            self._print("\n", 0)
-
-        # Prints each player's remaining pieces
-        self._print(f"\nCurrent Player: Player {self.blokus.curr_player}\n", 0)
-        self._print("\nRemaining Pieces:\n", 2)
+        # Compute just the non-dot cells of the frame, with no I/O:
+        # placed pieces, then uncovered start positions, then the
+        # pending piece on top. Everything else is background dots,
+        # which stay on screen from the first draw.
+        piece_squares = self.piece.squares() if self.piece else []
+        if self.piece is not None and self._piece_collision_dirty:
+            self._cached_collision = self.blokus.any_collisions(self.piece)
+            self._piece_collision_dirty = False
+        has_collision = self.piece is not None and self._cached_collision
+        piece_color = self.colors[self.blokus.curr_player - 1]
+
+        new_kind = np.zeros((self.size, self.size), dtype=np.uint8)
+        new_color = np.zeros_like(new_kind)
+
+        placed = self.placed_color != 0
+        new_kind[placed] = _CELL_PLACED
+        new_color[placed] = self.placed_color[placed]
+
+        for (row, col) in self._start_cells:
+            if not self.placed_color[row, col]:
+                new_kind[row, col] = _CELL_START
+                new_color[row, col] = self.colors[4]
+
+        if not has_collision:
+            for (row, col) in piece_squares:
+                if 0 <= row < self.size and 0 <= col < self.size:
+                    new_kind[row, col] = _CELL_PIECE
+                    new_color[row, col] = piece_color
+
+        if self._prev_kind is None:
+            # First draw paints the whole dot background once; after
+            # that only cells flagged by the diff get repainted
+            for row in range(self.size):
+                self._print(self._empty_row, 0, row, 0)
+            self._prev_kind = np.zeros_like(new_kind)
+            self._prev_color = np.zeros_like(new_color)
+
+        # Vectorized damage mask over both arrays at once
+        diff = (new_kind != self._prev_kind) | (new_color != self._prev_color)
+
+        # Emit the damage, coalescing horizontal runs of the same
+        # color into a single addstr per run
+        run_row, run_start = 0, None
+        run_str, run_color = "", 0
+        for row, col in np.argwhere(diff):
+            row, col = int(row), int(col)
+            symbol = _CELL_SYMBOLS[new_kind[row, col]]
+            color = int(new_color[row, col])
+            if run_start is not None and row == run_row and \
+                    color == run_color and col == run_start + len(run_str):
+                run_str += symbol
+            else:
+                if run_start is not None:
+                    self._print(run_str, run_color, run_row, run_start)
+                run_row, run_start = row, col
+                run_str, run_color = symbol, color
+        if run_start is not None:
+            self._print(run_str, run_color, run_row, run_start)
+        self._prev_kind, self._prev_color = new_kind, new_color
+
+        self.draw_footer()
+
+        # Stage everything on the virtual screen, then apply it once
+        self.screen.noutrefresh()
+        curses.doupdate()
+
+    def draw_footer(self) -> None:
+        """
+        Draws the status area below the grid: the current player, each
+        player's remaining pieces and score, and the game over message
+
+        Input:
+            None besides self
+
+        Returns [None]: prints the footer
+        """
+        players = range(1, self.blokus.num_players + 1)
+
+        # Cheap signature of everything the footer displays; skip the
+        # string building and row writes when nothing changed
+        key = (self.blokus.curr_player, self.blokus.game_over,
+               frozenset(self.blokus.retired_players),
+               tuple(len(self.blokus.remaining_shapes(p)) for p in players),
+               tuple(self.blokus.get_score(p) for p in players))
+        if key == self._footer_key:
+            return
+        self._footer_key = key
+
+        self._write_line(self.size + 1,
+                         [(f"Current Player: Player {self.blokus.curr_player}", 0)])
+        self._write_line(self.size + 3, [("Remaining Pieces:", 2)])
+
         for player in range(1, self.blokus.num_players + 1):
             color = self.colors[player - 1]
-            remaining_pieces = ""
 
             # reprints remaining shapes every time a shape is used
-            for shape in self.blokus.remaining_shapes(player):
-                remaining_pieces += shape.value + " "
-            self._print(f"Player {player}: {remaining_pieces}", color)
+            remaining_pieces = " ".join(
+                shape.value for shape in self.blokus.remaining_shapes(player))
+
+            segments = [(f"Player {player}: {remaining_pieces} ", color)]
             if player in self.blokus.retired_players:
-                self._print(" (Retired)", self.colors[3])
-            self._print(f" Score: {self.blokus.get_score(player)}\n", self.colors[4])
+                segments.append((" (Retired)", self.colors[3]))
+            segments.append((f" Score: {self.blokus.get_score(player)}",
+                             self.colors[4]))
+            self._write_line(self.size + 3 + player, segments)
 
-        # Prints game over screen 
+        # The game over screen shares the status line
         if self.blokus.game_over:
             winners = self.blokus.winners
+            assert winners is not None
             if len(winners) == 1:
-                self._print(f"\nGame Over! Player {winners[0]} wins!\n", self.colors[2])
+                message = f"Game Over! Player {winners[0]} wins!"
             else:
                 winner_str = ", ".join(map(str, winners))
-                self._print(f"\nGame Over! Players {winner_str} are tied!\n", self.colors[2])
+                message = f"Game Over! Players {winner_str} are tied!"
+            self._write_line(self._status_row, [(message, self.colors[2])])
 
     def choose_piece(self, shape_key: Optional[ShapeKind] = None) -> None:
         """
@@ -132,7 +307,7 @@ class BlokusTUI:
         
         Return [none]: updates self.piece
         """
-        remaining_shapes = self.blokus.remaining_shapes(self.blokus.curr_player)
+        remaining_shapes = self._remaining[self.blokus.curr_player]
         if not remaining_shapes:
             self.piece = None
             return
@@ -145,54 +320,77 @@ class BlokusTUI:
         shape = self.dict_shapes[selected_shape]
         self.piece = Piece(shape)
         self.piece.set_anchor((self.size // 2, self.size // 2))
-        self.draw_board()
+        self._piece_collision_dirty = True
+
 
+    def _apply_piece_key(self, key: int) -> bool:
+        """
+        Applies a movement, rotation, or flip key to the pending piece
+
+        Input:
+            key [int]: the key code from getch
+
+        Returns [bool]: whether the key was one of those actions
+        """
+        action = self._piece_actions.get(key)
+        if action is None:
+            return False
+
+        assert self.piece is not None
+        action(self.piece)
+        self._piece_collision_dirty = True
+        return True
 
     def handle_user_input(self) -> None:
         """
         Handles user input for moving the pending piece
 
-        Input: 
+        Input:
             None besides self
-        
+
         Returns [None] interacts with keyboard
         """
+        # Block until a key arrives, so the process sleeps while idle
+        self.screen.timeout(-1)
         self.draw_board()
 
         while True:
             key = self.screen.getch()
 
+            # Only redraw when a key actually changed some state
+            dirty = False
+
             if key in self.key_actions:
                 self.choose_piece(self.key_actions[key])
+                dirty = True
 
             if self.piece:  # Only process movement if a piece is selected
-                r, c = self.piece.anchor
-
-                if key == curses.KEY_UP:
-                    self.piece.set_anchor((r - 1, c))  # Move the piece up
-                elif key == curses.KEY_DOWN:
-                    self.piece.set_anchor((r + 1, c))  # Move the piece down
-                elif key == curses.KEY_LEFT:
-                    self.piece.set_anchor((r, c - 1))  # Move the piece left
-                elif key == curses.KEY_RIGHT:
-                    self.piece.set_anchor((r, c + 1))  # Move the piece right
+                if self._apply_piece_key(key):
+                    dirty = True
+
+                    # Coalesce queued movement keys (arrow autorepeat)
+                    # into this one redraw; anything else is pushed
+                    # back for the blocking loop to handle
+                    self.screen.nodelay(True)
+                    while (pending := self.screen.getch()) != -1:
+                        if not self._apply_piece_key(pending):
+                            curses.ungetch(pending)
+                            break
+                    self.screen.nodelay(False)
                 elif key == 10:  # Enter Key
                     if self.place_piece():
                         self.piece = None
-                elif key == ord('r'):
-                    self.piece.rotate_right()
-                elif key == ord('e'):
-                    self.piece.rotate_left()
-                elif key == ord(' '):
-                    self.piece.flip_horizontally()
+                    dirty = True
                 elif key == ord('q'):
                     self.blokus.retire()
                     self.piece = None
+                    dirty = True
 
             if key == 27:  # Escape Key
                 break
 
-            self.draw_board()
+            if dirty:
+                self.draw_board()
 
     def place_piece(self) -> bool:
         """
@@ -203,13 +401,16 @@ class BlokusTUI:
 
         Returns [bool]: True if legal to place, false otherwise
         """
-        color = self.colors[self.blokus.curr_player - 1]
+        player = self.blokus.curr_player
+        color = self.colors[player - 1]
         if self.blokus.maybe_place(self.piece):
-            for square in self.piece.squares():
-                self.placed_pieces[square] = (color, "▣")
+            self._remaining[player].discard(self.piece.shape.kind)
+            for (row, col) in self.piece.squares():
+                self.placed_color[row, col] = color
             return True
         else:
-            self._print('\nNot legal placement', self.colors[4])
+            self._write_line(self._status_row,
+                             [('Not legal placement', self.colors[4])])
             return False
 
 def run_tui(game: str, num_players: int, size: int, start_positions: Optional[Set[Tuple[int, int]]], screen: 'curses._CursesWindow') -> None:
@@ -226,31 +427,12 @@ def run_tui(game: str, num_players: int, size: int, start_positions: Optional[Se
 
     Returns [none]: runs the tui
     """
-    if not start_positions:
-        if game == 'mono':
+    if not start_positions and game in GAME_MODES:
+        requested_players = num_players
+        num_players, size, mode_positions = GAME_MODES[game]
+        start_positions = set(mode_positions)
+        if game == 'mini' and requested_players == 1:
             num_players = 1
-            size = 11
-            start_positions = set([(5, 5)])
-        elif game == 'duo':
-            num_players = 2
-            size = 14
-            start_positions = set([(4, 4), (9, 9)])
-        elif game == 'classic-2':
-            num_players = 2
-            size = 20
-            start_positions = set([(0, 0), (19, 19)])
-        elif game == 'classic-3':
-            num_players = 3
-            size = 20
-            start_positions = set([(0, 0), (19, 0), (0, 19)])
-        elif game == 'classic-4':
-            num_players = 4
-            size = 20
-            start_positions = set([(0, 0), (19, 0), (0, 19), (19, 19)])
-        elif game == 'mini':
-            num_players = 1 if num_players == 1 else 2
-            size = 5
-            start_positions = set([(0, 0), (4, 4)])
 
     blokus = Blokus(num_players=num_players, size=size, start_positions=start_positions)
     tui = BlokusTUI(blokus, screen)